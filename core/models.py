@@ -4,9 +4,11 @@
 Этот модуль содержит основные классы для работы с данными в приложении.
 """
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Union
+from typing import Dict, List, Optional, Tuple, Union
 from datetime import datetime
 
+from PyQt5.QtCore import QObject, pyqtSignal
+
 
 @dataclass
 class TickerData:
@@ -96,6 +98,14 @@ class ExchangeData:
         return self.assets.get(symbol)
 
 
+class AppStateSignals(QObject):
+    """
+    Сигналы состояния приложения.
+    """
+    # биржа, символ, цена, спот цена (None, если не передана)
+    priceUpdated = pyqtSignal(str, str, float, object)
+
+
 class AppState:
     """
     Состояние приложения с данными от всех бирж.
@@ -113,6 +123,9 @@ class AppState:
         # Инициализируем атрибут _exchanges только если он не существует
         if not hasattr(self, '_exchanges'):
             self._exchanges: Dict[str, ExchangeData] = {}
+            # Плоский индекс (биржа, символ) -> AssetPrice для поиска за один шаг
+            self._assets: Dict[Tuple[str, str], AssetPrice] = {}
+            self.signals = AppStateSignals()
     
     def get_exchange(self, name: str) -> Optional[ExchangeData]:
         """
@@ -158,6 +171,21 @@ class AppState:
             exchange = self.add_exchange(exchange_name)
         
         exchange.update_asset(symbol, price, usd_price, spot_price)
+        self._assets[(exchange.name, symbol)] = exchange.assets[symbol]
+        self.signals.priceUpdated.emit(exchange.name, symbol, price, spot_price)
+    
+    def get_asset(self, exchange_name: str, symbol: str) -> Optional[AssetPrice]:
+        """
+        Получить данные по активу на определенной бирже.
+        
+        Args:
+            exchange_name: Название биржи (в нижнем регистре)
+            symbol: Символ актива
+            
+        Returns:
+            Данные по активу или None, если актив не найден
+        """
+        return self._assets.get((exchange_name, symbol))
     
     def get_exchanges(self) -> List[ExchangeData]:
         """
@@ -32,12 +32,12 @@ def format_number(value: float, decimal_places: int = 2) -> str:
     Returns:
         Отформатированная строка
     """
-    logger.debug(f"format_number called with: value={value}, type={type(value)}, decimal_places={decimal_places}")
+    logger.debug("format_number called with: value=%s, decimal_places=%s", value, decimal_places)
     try:
         if value is None:
             return "0"
         formatted_str = f"{value:,.{decimal_places}f}"
-        logger.debug(f"format_number returning: {formatted_str}")
+        logger.debug("format_number returning: %s", formatted_str)
         return formatted_str
     except Exception as e:
         logger.error(f"Ошибка форматирования числа {value}: {e}")
@@ -56,7 +56,7 @@ def format_currency(value: float, currency: str = "₽", decimal_places: int = 2
     Returns:
         Отформатированная строка с символом валюты
     """
-    logger.debug(f"format_currency called with: value={value}, type={type(value)}, decimal_places={decimal_places}")
+    logger.debug("format_currency called with: value=%s, decimal_places=%s", value, decimal_places)
     try:
         if value is None:
             return f"0 {currency}"
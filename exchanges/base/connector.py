@@ -9,11 +9,26 @@ import logging
 from abc import ABC, abstractmethod
 from typing import Dict, List, Optional, Any, Set
 
+from PyQt5.QtCore import QObject, pyqtSignal
+
 from core.models import TickerData, AppState, AssetPrice
 
 logger = logging.getLogger(__name__)
 
 
+class ConnectorSignals(QObject):
+    """
+    Сигналы коннектора.
+    
+    Коннектор работает в собственном потоке, поэтому данные передаются
+    в UI-поток через сигналы, а не прямой записью в AppState.
+    """
+    # биржа, символ, цена, цена в USD, спот цена
+    priceUpdated = pyqtSignal(str, str, float, object, object)
+    # биржа, состояние соединения
+    connectionChanged = pyqtSignal(str, bool)
+
+
 class BaseConnector(ABC):
     """
     Абстрактный базовый класс для всех коннекторов к биржам.
@@ -38,6 +53,7 @@ class BaseConnector(ABC):
         self.stop_event = asyncio.Event()
         self.is_connected = False
         self.app_state = AppState()
+        self.signals = ConnectorSignals()
         
     def _generate_trading_pairs(self) -> List[str]:
         """
@@ -120,10 +136,7 @@ class BaseConnector(ABC):
                 return
             
             self.is_connected = True
-            exchange = self.app_state.get_exchange(self.exchange_name)
-            if exchange is None:
-                exchange = self.app_state.add_exchange(self.exchange_name)
-            exchange.connected = True
+            self.signals.connectionChanged.emit(self.exchange_name, True)
             
             await self.subscribe_to_tickers(self.trading_pairs)
             await self.process_updates()
@@ -132,9 +145,7 @@ class BaseConnector(ABC):
         finally:
             await self.disconnect()
             self.is_connected = False
-            exchange = self.app_state.get_exchange(self.exchange_name)
-            if exchange:
-                exchange.connected = False
+            self.signals.connectionChanged.emit(self.exchange_name, False)
     
     async def stop(self) -> None:
         """
@@ -151,13 +162,16 @@ class BaseConnector(ABC):
         """
         Обновляет состояние приложения с новыми данными.
         
+        Вызывается из потока коннектора: данные отправляются сигналом
+        priceUpdated и записываются в AppState уже в UI-потоке.
+        
         Args:
             symbol: Символ актива
             price: Цена актива
             usd_price: Цена в USD (опционально)
             spot_price: Спот цена (опционально)
         """
-        self.app_state.update_asset(
+        self.signals.priceUpdated.emit(
             self.exchange_name, 
             symbol, 
             price,
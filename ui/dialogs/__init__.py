@@ -3,4 +3,4 @@
 
 Содержит диалоговые окна, используемые в приложении.
 """
-from ui.dialogs.settings_dialog import SettingsDialog 
\ No newline at end of file
+from ui.dialogs.settings_dialog import SettingsDialog, SettingsManager, settings_manager 
\ No newline at end of file
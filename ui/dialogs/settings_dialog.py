@@ -4,7 +4,7 @@
 import logging
 from typing import Dict, Any
 
-from PyQt5.QtCore import QSettings, Qt
+from PyQt5.QtCore import QObject, QSettings, Qt, pyqtSignal
 from PyQt5.QtGui import QFont
 from PyQt5.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QTabWidget, QWidget,
@@ -16,6 +16,22 @@ from PyQt5.QtWidgets import (
 logger = logging.getLogger(__name__)
 
 
+class SettingsManager(QObject):
+    """
+    Источник сигналов об изменении сохраненных настроек.
+    
+    Виджеты, кэширующие значения из QSettings, подписываются на эти сигналы,
+    чтобы не перечитывать настройки при каждом обновлении.
+    """
+    
+    # Сигнал, который испускается после сохранения настроек
+    changed = pyqtSignal()
+
+
+# Единственный экземпляр менеджера настроек
+settings_manager = SettingsManager()
+
+
 class SettingsDialog(QDialog):
     """
     Диалог настроек приложения.
@@ -358,6 +374,7 @@ class SettingsDialog(QDialog):
                 self.settings.setValue(f"{exchange_name}/ws_url", widgets["ws_url"].text())
         
         logger.info("Настройки сохранены")
+        settings_manager.changed.emit()
     
     def _apply_settings(self):
         """Применение настроек."""
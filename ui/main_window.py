@@ -4,19 +4,21 @@
 import logging
 import os
 import sys
-from typing import Optional, Dict, Set, Any
+import time
+from typing import Optional, Dict, Set, Any, Tuple
 
-from PyQt5.QtCore import QSettings, QSize, QTimer, Qt
-from PyQt5.QtGui import QIcon, QFont, QPixmap, QColor
+from PyQt5.QtCore import QSettings, QSignalBlocker, QSize, QTimer, Qt, pyqtSignal
+from PyQt5.QtGui import QIcon, QFont, QPixmap
 from PyQt5.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, 
     QPushButton, QLabel, QComboBox, QSizePolicy, QAction, QMenu,
-    QStatusBar, QFrame, QSplitter, QTabWidget, QGraphicsDropShadowEffect,
+    QStatusBar, QFrame, QSplitter, QTabWidget,
     QApplication, QMessageBox, QTabBar,
     QDialog
 )
 
 from config import APP_SETTINGS, UI_SETTINGS
+from core.models import AppState
 from ui.widgets.info_widget import InfoWidget
 from ui.dialogs.settings_dialog import SettingsDialog
 import asyncio
@@ -42,6 +44,28 @@ except ImportError as e:
 
 # logger = logging.getLogger(__name__) # Убираем дублирующее определение отсюда
 
+# Доступные масштабы окна: текст пункта меню -> коэффициент
+_SCALE_MAP: Dict[str, float] = {
+    "70%": 0.70,
+    "85%": 0.85,
+    "100%": 1.0,
+    "115%": 1.15,
+    "130%": 1.30,
+}
+
+# Стиль полос, перекрывающих линию под вкладками
+_TAB_LINE_COVER_STYLE = """
+    background-color: #f8f8f5;
+    border: none;
+"""
+
+# Стиль содержимого текущей вкладки
+_TAB_CONTENT_STYLE = """
+    background-color: #f8f8f5;
+    border-top: none;
+    margin-top: -1px;
+"""
+
 class MainWindow(QMainWindow):
     """
     Главное окно приложения.
@@ -49,14 +73,24 @@ class MainWindow(QMainWindow):
     Управляет основным интерфейсом пользователя.
     """
     
+    # Общий такт синхронизации UI для всех CryptoLabel (несет строку времени)
+    ui_tick = pyqtSignal(str)
+    
     _instance_count = 0
     
     _instance = None
     
     _initialized = False
     
+    # Биржи в порядке отображения и их ключи в нижнем регистре
+    EXCHANGES = ("Binance", "Bybit", "CommEX", "Garantex")
+    _EXCHANGES_LC = tuple(exchange.lower() for exchange in EXCHANGES)
+    
     _connectors: Dict[str, Any] = {}
     
+    # Цикл событий и поток, в которых работает каждый асинхронный коннектор
+    _connector_loops: Dict[str, Tuple[asyncio.AbstractEventLoop, threading.Thread]] = {}
+    
     @classmethod
     def get_instance(cls):
         """
@@ -69,8 +103,7 @@ class MainWindow(QMainWindow):
             cls._instance = MainWindow()
         else:
             logger.info("Запрос существующего экземпляра главного окна")
-            cls._instance.activateWindow()
-            cls._instance.raise_()
+            cls._instance._ensure_foreground()
             
         return cls._instance
     
@@ -94,8 +127,7 @@ class MainWindow(QMainWindow):
                     cls._initialized = False
                 else:
                     logger.info("Возвращение существующего экземпляра главного окна")
-                    cls._instance.activateWindow()
-                    cls._instance.raise_()
+                    cls._instance._ensure_foreground()
             except RuntimeError:
                 logger.info("Старый экземпляр был удален, создаем новый")
                 cls._instance = super(MainWindow, cls).__new__(cls)
@@ -108,8 +140,7 @@ class MainWindow(QMainWindow):
         if self._initialized:
             logger.info("Повторная инициализация пропущена - окно уже инициализировано")
             if self.isVisible():
-                self.activateWindow()
-                self.raise_()
+                self._ensure_foreground()
             return
             
         logger.info("Инициализация главного окна")
@@ -119,10 +150,28 @@ class MainWindow(QMainWindow):
         
         self.settings = QSettings()
         self.info_widget = None
+        # Кнопки фильтров боковой панели по имени объекта ("binanceButton", "btcButton", ...)
+        self._buttons: Dict[str, QPushButton] = {}
+        self._tab_widget: Optional[QTabWidget] = None
+        self._cover_line: Optional[QFrame] = None
+        self._cover_line2: Optional[QFrame] = None
+        
+        # Таймер, откладывающий обновление перекрытия линии вкладок до конца изменения размера
+        self._cover_debounce = QTimer(self)
+        self._cover_debounce.setSingleShot(True)
+        self._cover_debounce.setInterval(50)
+        self._cover_debounce.timeout.connect(self._update_tab_line_cover)
+        
         self._initializing = False
         self._init_ui()
         self._load_window_settings()
         
+        # Цены приходят сигналом AppState.priceUpdated; общий такт раз в 5 секунд
+        # остается резервной синхронизацией всех CryptoLabel с AppState
+        self._ui_tick_timer = QTimer(self)
+        self._ui_tick_timer.timeout.connect(self._broadcast_tick)
+        self._ui_tick_timer.start(5000)
+        
         self._init_connectors()
         
         MainWindow._initialized = True
@@ -167,6 +216,7 @@ class MainWindow(QMainWindow):
             
             tab_widget = QTabWidget()
             tab_widget.setObjectName("mainTabs")
+            self._tab_widget = tab_widget
             tab_widget.setTabPosition(QTabWidget.North)
             tab_widget.setTabsClosable(False)
             tab_widget.setMovable(True)
@@ -174,6 +224,8 @@ class MainWindow(QMainWindow):
             
             self.info_widget = InfoWidget(self)
             self.info_widget.setObjectName("infoWidgetInstance")
+            # Метки InfoWidget синхронизируются с AppState по общему такту
+            self.ui_tick.connect(self.info_widget.tick)
             tab_widget.addTab(self.info_widget, "Курсы")
             
             charts_widget = self._create_charts_widget()
@@ -184,6 +236,10 @@ class MainWindow(QMainWindow):
             stats_widget.setObjectName("statsWidget")
             tab_widget.addTab(stats_widget, "Статистика")
             
+            # Полосы, перекрывающие линию под вкладками (позиционируются в _update_tab_line_cover)
+            self._cover_line = self._create_tab_line_cover(tab_widget, "tabLineCover", 6)
+            self._cover_line2 = self._create_tab_line_cover(tab_widget, "tabLineCover2", 4)
+            
             main_splitter.addWidget(tab_widget)
             
             main_splitter.setSizes([200, 800])
@@ -221,7 +277,7 @@ class MainWindow(QMainWindow):
             if hasattr(connector_instance, 'stop'):
                 try:
                     if asyncio.iscoroutinefunction(connector_instance.stop):
-                        asyncio.run(connector_instance.stop()) 
+                        self._stop_connector_loop(name, connector_instance)
                     else:
                         connector_instance.stop()
                     logger.info(f"Коннектор {name} остановлен.")
@@ -231,10 +287,75 @@ class MainWindow(QMainWindow):
         MainWindow._instance = None
         MainWindow._initialized = False
     
+    def _stop_connector_loop(self, name: str, connector_instance: Any):
+        """
+        Останавливает асинхронный коннектор в его собственном цикле событий.
+        
+        Args:
+            name: Ключ коннектора
+            connector_instance: Экземпляр коннектора
+        """
+        loop_thread = self._connector_loops.pop(name, None)
+        if loop_thread is None:
+            # Коннектор уже остановлен (например, при повторном вызове из aboutToQuit)
+            return
+        
+        loop, thread = loop_thread
+        if loop.is_closed():
+            return
+        try:
+            if loop.is_running():
+                future = asyncio.run_coroutine_threadsafe(connector_instance.stop(), loop)
+                future.result(timeout=5.0)
+        except Exception as e:
+            logger.error(f"Ошибка при остановке коннектора {name} в его цикле событий: {e}")
+        finally:
+            # Останавливаем цикл и в случае ошибки, и если он еще не успел запуститься
+            loop.call_soon_threadsafe(loop.stop)
+        thread.join(timeout=2.0)
+    
+    def _on_connector_price(self, exchange_name: str, symbol: str, price: float,
+                            usd_price: Optional[float], spot_price: Optional[float]):
+        """
+        Записывает цену, полученную от коннектора, в AppState.
+        
+        Args:
+            exchange_name: Название биржи
+            symbol: Символ актива
+            price: Цена актива
+            usd_price: Цена в USD (опционально)
+            spot_price: Спот цена (опционально)
+        """
+        AppState().update_asset(exchange_name, symbol, price, usd_price, spot_price)
+    
+    def _on_connector_connection(self, exchange_name: str, connected: bool):
+        """
+        Записывает состояние соединения коннектора в AppState.
+        
+        Args:
+            exchange_name: Название биржи
+            connected: Установлено ли соединение
+        """
+        app_state = AppState()
+        exchange = app_state.get_exchange(exchange_name)
+        if exchange is None:
+            exchange = app_state.add_exchange(exchange_name)
+        exchange.connected = connected
+    
+    def _broadcast_tick(self):
+        """Рассылает общий такт обновления всем подписанным виджетам."""
+        # Время форматируется один раз на такт, а не в каждом CryptoLabel
+        ts_str = time.strftime("%H:%M:%S", time.localtime())
+        self.ui_tick.emit(ts_str)
+    
+    def _ensure_foreground(self):
+        """Выводит окно на передний план, если оно еще не активно."""
+        if not self.isActiveWindow():
+            self.activateWindow()
+            self.raise_()
+    
     def showEvent(self, event):
         super().showEvent(event)
-        self.activateWindow()
-        self.raise_()
         logger.info("Окно показано пользователю")
         
     
@@ -327,11 +448,12 @@ class MainWindow(QMainWindow):
         exchange_header.setStyleSheet("color: #303030;")
         exchange_layout.addWidget(exchange_header)
         
-        for exchange in ["Binance", "Bybit", "CommEX", "Garantex"]:
+        for exchange in self.EXCHANGES:
             btn = QPushButton(exchange, exchange_group)
             btn.setCheckable(True)
             btn.setChecked(True)
             btn.setObjectName(f"{exchange.lower()}Button")
+            self._buttons[btn.objectName()] = btn
             btn.setStyleSheet("""
                 QPushButton {
                     text-align: left;
@@ -350,7 +472,7 @@ class MainWindow(QMainWindow):
                     background-color: #ffebeb;
                 }
             """)
-            btn.toggled.connect(lambda checked, e=exchange.lower(): self._toggle_exchange(e, checked))
+            btn.toggled.connect(lambda checked, e=exchange.lower(): self._toggle_exchange(e, checked), Qt.DirectConnection)
             exchange_layout.addWidget(btn)
         
         layout.addWidget(exchange_group)
@@ -373,6 +495,7 @@ class MainWindow(QMainWindow):
             btn.setCheckable(True)
             btn.setChecked(True)
             btn.setObjectName(f"{crypto.lower()}Button")
+            self._buttons[btn.objectName()] = btn
             btn.setStyleSheet("""
                 QPushButton {
                     text-align: left;
@@ -391,7 +514,7 @@ class MainWindow(QMainWindow):
                     background-color: #ffebeb;
                 }
             """)
-            btn.toggled.connect(lambda checked, c=crypto.lower(): self._toggle_crypto(c, checked))
+            btn.toggled.connect(lambda checked, c=crypto.lower(): self._toggle_crypto(c, checked), Qt.DirectConnection)
             crypto_layout.addWidget(btn)
         
         layout.addWidget(crypto_group)
@@ -564,19 +687,19 @@ class MainWindow(QMainWindow):
         if file_menu:
             refresh_action = QAction("Обновить данные", self)
             refresh_action.setShortcut("F5")
-            refresh_action.triggered.connect(self._refresh_data)
+            refresh_action.triggered.connect(self._refresh_data, Qt.DirectConnection)
             file_menu.addAction(refresh_action)
             
             settings_action = QAction("Настройки", self)
             settings_action.setShortcut("Ctrl+P")
-            settings_action.triggered.connect(self._open_settings)
+            settings_action.triggered.connect(self._open_settings, Qt.DirectConnection)
             file_menu.addAction(settings_action)
             
             file_menu.addSeparator()
             
             exit_action = QAction("Выход", self)
             exit_action.setShortcut("Ctrl+Q")
-            exit_action.triggered.connect(self._handle_exit_action)
+            exit_action.triggered.connect(self._handle_exit_action, Qt.DirectConnection)
             file_menu.addAction(exit_action)
         else:
             logger.error("main_menu.addMenu('Файл') вернуло None. Меню 'Файл' не будет создано.")
@@ -584,18 +707,18 @@ class MainWindow(QMainWindow):
         view_menu = main_menu.addMenu("Вид")
         if view_menu:
             scale_menu = QMenu("Масштаб", self)
-            for scale in ['70%', '85%', '100%', '115%', '130%']:
+            for scale in _SCALE_MAP:
                 scale_action = QAction(scale, self)
-                scale_action.triggered.connect(lambda checked, s=scale: self.scale_box.setCurrentText(s))
+                scale_action.triggered.connect(lambda checked, s=scale: self._apply_scale(s), Qt.DirectConnection)
                 scale_menu.addAction(scale_action)
             view_menu.addMenu(scale_menu)
             
             exchanges_menu = QMenu("Биржи", self)
-            for exchange in ["Binance", "Bybit", "CommEX", "Garantex"]:
+            for exchange in self.EXCHANGES:
                 exchange_action = QAction(exchange, self)
                 exchange_action.setCheckable(True)
                 exchange_action.setChecked(True)
-                exchange_action.triggered.connect(lambda checked, e=exchange.lower(): self._toggle_exchange(e, checked))
+                exchange_action.triggered.connect(lambda checked, e=exchange.lower(): self._toggle_exchange(e, checked), Qt.DirectConnection)
                 exchanges_menu.addAction(exchange_action)
             view_menu.addMenu(exchanges_menu)
         else:
@@ -604,7 +727,7 @@ class MainWindow(QMainWindow):
         help_menu = main_menu.addMenu("Справка")
         if help_menu:
             about_action = QAction("О программе", self)
-            about_action.triggered.connect(self._show_about)
+            about_action.triggered.connect(self._show_about, Qt.DirectConnection)
             help_menu.addAction(about_action)
         else:
             logger.error("main_menu.addMenu('Справка') вернуло None. Меню 'Справка' не будет создано.")
@@ -635,14 +758,9 @@ class MainWindow(QMainWindow):
         # tab_style = """ ... """ 
         # self.setStyleSheet(button_style + panel_style + combo_style + general_style + tab_style)
         
-        # shadow = QGraphicsDropShadowEffect()
-        # shadow.setBlurRadius(15)
-        # shadow.setColor(QColor(0, 0, 0, 60))
-        # shadow.setOffset(0, 2)
-        
-        # top_panel = self.findChild(QFrame, "topPanel")
-        # if top_panel:
-        #     top_panel.setGraphicsEffect(shadow)
+        # Тень верхней панели задается в custom.css (QFrame#topPanel) нижней рамкой,
+        # а не через QGraphicsDropShadowEffect: эффект отключает нативную композицию
+        # виджета и заставляет перерисовывать его программно при каждом обновлении.
     
     def _toggle_exchange(self, exchange_name: str, visible: bool):
         self.settings.setValue(f"filters/exchange_{exchange_name}", visible)
@@ -654,8 +772,7 @@ class MainWindow(QMainWindow):
     def _toggle_crypto(self, crypto_name: str, visible: bool):
         self.settings.setValue(f"filters/crypto_{crypto_name}", visible)
         
-        exchanges = ["binance", "bybit", "commex", "garantex"]
-        for exchange in exchanges:
+        for exchange in self._EXCHANGES_LC:
             if self.info_widget:
                 self.info_widget.set_asset_visibility(exchange, crypto_name.upper(), visible)
         
@@ -678,22 +795,9 @@ class MainWindow(QMainWindow):
             except Exception as e:
                 logger.error(f"Ошибка применения темы: {e}", exc_info=True)
 
-            # 2. Применяем изменения шрифта/визуала и обновляем UI CryptoLabels
-            if self.info_widget:
-                try:
-                    # Получаем все виджеты CryptoLabel
-                    crypto_labels = self.info_widget.get_crypto_labels()
-                    logger.info(f"Найдено {len(crypto_labels)} CryptoLabel виджетов для обновления настроек.")
-                    for label in crypto_labels:
-                        if hasattr(label, '_apply_visual_settings'):
-                            label._apply_visual_settings() 
-                        # Обновляем UI, чтобы перерисовались спреды с новыми настройками
-                        if hasattr(label, '_update_ui'):
-                            label._update_ui()
-                    logger.info("Визуальные настройки и UI для CryptoLabel обновлены.")
-                except Exception as e:
-                     logger.error(f"Ошибка при обновлении CryptoLabel после настроек: {e}", exc_info=True)
-            
+            # Шрифты и спреды CryptoLabel InfoWidget обновляет сам по
+            # SettingsManager.changed при каждом сохранении (OK или Apply)
+
             # Можно оставить вызов _refresh_data, если он нужен для других целей,
             # но обновление CryptoLabel уже должно было произойти.
             # self._refresh_data() 
@@ -703,9 +807,8 @@ class MainWindow(QMainWindow):
     def _apply_scale(self, scale_text: str):
         self.settings.setValue("window/scale", scale_text)
         
-        try:
-            scale = float(scale_text.strip('%')) / 100.0
-        except ValueError:
+        scale = _SCALE_MAP.get(scale_text)
+        if scale is None:
             logger.error(f"Invalid scale value: {scale_text}")
             return
         
@@ -727,8 +830,7 @@ class MainWindow(QMainWindow):
         msg_box.exec_()
     
     def _refresh_data(self):
-        from datetime import datetime
-        current_time = datetime.now().strftime("%H:%M:%S")
+        current_time = time.strftime("%H:%M:%S", time.localtime())
         
         self.activity_label.setStyleSheet("color: orange;")
         
@@ -738,8 +840,10 @@ class MainWindow(QMainWindow):
         
         self.status_label.setText("Данные обновлены")
         
+        # Цены приходят в CryptoLabel сигналом AppState.priceUpdated;
+        # ручное обновление - это внеочередной такт синхронизации
         if self.info_widget:
-            self.info_widget._update_data()
+            self._broadcast_tick()
         
     def _handle_exit_action(self):
         """Обработчик для действия выхода из меню."""
@@ -784,16 +888,19 @@ class MainWindow(QMainWindow):
             logger.warning("Боковая панель или виджет информации еще не созданы. Пропуск загрузки фильтров.")
             return
 
-        exchanges = ["binance", "bybit", "commex", "garantex"]
-        for exchange_key in exchanges:
-            visible_str = self.settings.value(f"filters/exchange_{exchange_key}", "true")
+        # Читаем всю группу фильтров за один проход
+        self.settings.beginGroup("filters")
+        filter_values = {key: self.settings.value(key, "true") for key in self.settings.childKeys()}
+        self.settings.endGroup()
+
+        for exchange_key in self._EXCHANGES_LC:
+            visible_str = filter_values.get(f"exchange_{exchange_key}", "true")
             visible = str(visible_str).lower() == 'true'
             
-            button = self.side_panel.findChild(QPushButton, f"{exchange_key}Button")
+            button = self._buttons.get(f"{exchange_key}Button")
             if button:
-                button.blockSignals(True)
-                button.setChecked(visible) 
-                button.blockSignals(False)
+                with QSignalBlocker(button):
+                    button.setChecked(visible)
             else:
                  logger.warning(f"Кнопка для биржи {exchange_key} не найдена.")
 
@@ -801,18 +908,17 @@ class MainWindow(QMainWindow):
 
         cryptos = ["btc", "eth", "usdt"]
         for crypto_key in cryptos:
-            visible_str = self.settings.value(f"filters/crypto_{crypto_key}", "true")
+            visible_str = filter_values.get(f"crypto_{crypto_key}", "true")
             visible = str(visible_str).lower() == 'true'
 
-            button = self.side_panel.findChild(QPushButton, f"{crypto_key}Button")
+            button = self._buttons.get(f"{crypto_key}Button")
             if button:
-                button.blockSignals(True)
-                button.setChecked(visible)
-                button.blockSignals(False)
+                with QSignalBlocker(button):
+                    button.setChecked(visible)
             else:
                 logger.warning(f"Кнопка для криптовалюты {crypto_key} не найдена.")
 
-            for exchange_key in exchanges:
+            for exchange_key in self._EXCHANGES_LC:
                 self.info_widget.set_asset_visibility(exchange_key, crypto_key.upper(), visible)
                  
         logger.info("Настройки фильтров загружены и применены.") 
@@ -831,53 +937,55 @@ class MainWindow(QMainWindow):
     def resizeEvent(self, event):
         super().resizeEvent(event)
         
-        QTimer.singleShot(10, self._update_tab_line_cover)
+        # Перезапуск таймера: обновление выполнится один раз после окончания изменения размера
+        self._cover_debounce.start()
+    
+    def _create_tab_line_cover(self, tab_widget: QTabWidget, name: str, height: int) -> QFrame:
+        """
+        Создает полосу, перекрывающую линию под вкладками.
+        
+        Стиль и высота задаются один раз; при изменении размера окна
+        полоса только перемещается и меняет ширину.
+        
+        Args:
+            tab_widget: Виджет вкладок
+            name: Имя объекта полосы
+            height: Высота полосы
+            
+        Returns:
+            Созданная полоса
+        """
+        cover_line = QFrame(tab_widget)
+        cover_line.setObjectName(name)
+        cover_line.setStyleSheet(_TAB_LINE_COVER_STYLE)
+        cover_line.setFixedHeight(height)
+        # Показывается после первого позиционирования в _update_tab_line_cover
+        cover_line.hide()
+        return cover_line
     
     def _update_tab_line_cover(self):
-        tab_widget = self.findChild(QTabWidget, "mainTabs")
-        if not tab_widget:
+        tab_widget = self._tab_widget
+        if not tab_widget or not self._cover_line or not self._cover_line2:
             return
             
-        cover_line = tab_widget.findChild(QFrame, "tabLineCover")
-        if not cover_line:
-            cover_line = QFrame(tab_widget)
-            cover_line.setObjectName("tabLineCover")
-            cover_line.setStyleSheet("""
-                background-color: #f8f8f5;
-                border: none;
-            """)
-            
         tab_bar = tab_widget.tabBar()
         if tab_bar:
-            cover_line.setFixedHeight(6)
-            cover_line.setFixedWidth(tab_widget.width())
-            
-            cover_line.move(0, tab_bar.height() - 1)
-            cover_line.show()
-            cover_line.raise_()
-            
-            cover_line2 = tab_widget.findChild(QFrame, "tabLineCover2")
-            if not cover_line2:
-                cover_line2 = QFrame(tab_widget)
-                cover_line2.setObjectName("tabLineCover2")
-                cover_line2.setStyleSheet("""
-                    background-color: #f8f8f5;
-                    border: none;
-                """)
+            width = tab_widget.width()
+            
+            self._cover_line.resize(width, self._cover_line.height())
+            self._cover_line.move(0, tab_bar.height() - 1)
             
-            cover_line2.setFixedHeight(4)
-            cover_line2.setFixedWidth(tab_widget.width())
-            cover_line2.move(0, tab_bar.height() + 2)
-            cover_line2.show()
-            cover_line2.raise_()
+            self._cover_line2.resize(width, self._cover_line2.height())
+            self._cover_line2.move(0, tab_bar.height() + 2)
+            
+            for cover_line in (self._cover_line, self._cover_line2):
+                if cover_line.isHidden():
+                    cover_line.show()
+                    cover_line.raise_()
             
             content_widget = tab_widget.currentWidget()
-            if content_widget:
-                content_widget.setStyleSheet("""
-                    background-color: #f8f8f5;
-                    border-top: none;
-                    margin-top: -1px;
-                """)
+            if content_widget and content_widget.styleSheet() != _TAB_CONTENT_STYLE:
+                content_widget.setStyleSheet(_TAB_CONTENT_STYLE)
                 content_widget.update() 
 
     def _init_connectors(self):
@@ -893,17 +1001,45 @@ class MainWindow(QMainWindow):
         if bybit_config:
             logger.info(f"Используется жестко заданная конфигурация для Bybit. Запуск коннектора... Base URL: {bybit_config['base_url']}")
             self._connectors['bybit'] = BybitConnector(exchange_name="bybit", config=bybit_config)
-            
-            connector_thread = threading.Thread(
-                target=lambda: asyncio.run(self._connectors['bybit'].start()),
-                daemon=True
-            )
-            connector_thread.start()
+            self._start_connector_loop('bybit', self._connectors['bybit'])
         else:
             logger.warning("Конфигурация для Bybit не определена (это неожиданно, т.к. она задана в коде).")
             
         # Здесь можно добавить инициализацию других коннекторов по аналогии 
 
+    def _start_connector_loop(self, name: str, connector_instance: Any):
+        """
+        Запускает коннектор в отдельном потоке с постоянным циклом событий.
+        
+        Цикл работает до явной остановки в _stop_connector_loop, поэтому
+        остановка коннектора планируется в тот же цикл, а не в новый.
+        
+        Args:
+            name: Ключ коннектора
+            connector_instance: Экземпляр коннектора
+        """
+        # Цены из потока коннектора попадают в AppState только в UI-потоке
+        connector_instance.signals.priceUpdated.connect(self._on_connector_price, Qt.QueuedConnection)
+        connector_instance.signals.connectionChanged.connect(self._on_connector_connection, Qt.QueuedConnection)
+        
+        loop = asyncio.new_event_loop()
+        
+        def run_loop():
+            asyncio.set_event_loop(loop)
+            loop.create_task(connector_instance.start())
+            try:
+                loop.run_forever()
+            finally:
+                pending = asyncio.all_tasks(loop)
+                for task in pending:
+                    task.cancel()
+                loop.run_until_complete(asyncio.gather(*pending, return_exceptions=True))
+                loop.close()
+        
+        connector_thread = threading.Thread(target=run_loop, name=f"{name}-connector", daemon=True)
+        self._connector_loops[name] = (loop, connector_thread)
+        connector_thread.start()
+
     def _handle_visibility_changed(self, crypto_key: str, visible: bool):
         # Implementation of _handle_visibility_changed method
         pass 
\ No newline at end of file
@@ -2,20 +2,241 @@
 Виджет для отображения информации о криптовалюте.
 """
 import logging
-from typing import Optional, Tuple
+from functools import lru_cache
+from typing import Dict, List, NamedTuple, Optional, Tuple
 from datetime import datetime
 from PyQt5.QtCore import QSettings, Qt, QTimer, QSize, pyqtSignal
-from PyQt5.QtGui import QFont, QColor, QPalette, QIcon
+from PyQt5.QtGui import QFont, QIcon
 from PyQt5.QtWidgets import (
-    QFrame, QLabel, QVBoxLayout, QHBoxLayout, QSizePolicy, 
-    QGraphicsDropShadowEffect, QWidget
+    QFrame, QLabel, QVBoxLayout, QHBoxLayout, QSizePolicy, QWidget
 )
 
 from core.utils import format_number, format_currency, format_percentage, get_trend_color
 from core.models import AppState, AssetPrice
+from ui.dialogs.settings_dialog import settings_manager
 
 logger = logging.getLogger(__name__)
 
+# Значения спредов по умолчанию (совпадают с диалогом настроек)
+_DEFAULT_SPREAD_PERCENTS = (0.50, 1.00, 1.50)
+
+# Стили, которые не зависят от настроек. Цвет тренда выбирается селекторами
+# по динамическому свойству "trend", поэтому при смене тренда стиль не
+# разбирается заново - достаточно сменить свойство и заново применить стиль.
+_STYLE_TREND_LABEL = """
+    QLabel { color: #FFC107; font-size: 14px; qproperty-alignment: AlignCenter; }
+    QLabel[trend="up"] { color: #4CAF50; font-weight: bold; }
+    QLabel[trend="down"] { color: #F44336; font-weight: bold; }
+"""
+
+# Шаблон стиля основной цены; шрифт подставляется из настроек
+_STYLE_PRICE_VALUE_TEMPLATE = """
+    QLabel {{ color: #303030; {base_style} }}
+    QLabel[trend="up"] {{ color: #4CAF50; }}
+    QLabel[trend="down"] {{ color: #F44336; }}
+"""
+
+_STYLE_PRICE_FRAME = """
+    QFrame#priceWidget {
+        background-color: #ffffff;
+        border-radius: 10px;
+        border: 1px solid #efefef;
+    }
+"""
+
+_STYLE_SPREAD_FRAME = """
+    QFrame#spreadWidget {
+        background-color: #ffffff;
+        border-radius: 10px;
+        border: 1px solid #efefef;
+    }
+"""
+
+# Общий стиль для метки спотовой цены (цвет наследуется от темы)
+_STYLE_SPOT_PRICE = """
+    QLabel#spot_price {
+        font-size: 14px;
+        qproperty-alignment: AlignLeft;
+    }
+"""
+
+# Стиль виджета со скрытым содержимым
+_STYLE_HIDDEN_CONTENTS = """
+    QFrame#cryptoWidget {
+        background-color: rgba(255, 255, 255, 0.5);
+        border-radius: 12px;
+        border: 1px solid #efefef;
+    }
+"""
+
+# Символы индикатора для значений свойства "trend"
+_TREND_SYMBOLS = {"up": "▲", "down": "▼", "flat": "●"}
+
+# Валюты, для которых показывается спотовая цена в долларах
+_FIAT_SPOT = frozenset(("BTC", "ETH"))
+
+# Значение свойства "trend" для каждого значения CryptoLabel.trend
+_TREND_STATES = {1: "up", -1: "down", 0: "flat"}
+
+# Общий объект QSettings для всех CryptoLabel (создается при первом обращении,
+# когда имя организации и приложения уже заданы в QApplication)
+_SHARED_SETTINGS: Optional[QSettings] = None
+
+
+def _shared_settings() -> QSettings:
+    """
+    Возвращает общий для всех CryptoLabel объект QSettings.
+    
+    Returns:
+        Экземпляр QSettings
+    """
+    global _SHARED_SETTINGS
+    if _SHARED_SETTINGS is None:
+        _SHARED_SETTINGS = QSettings()
+    return _SHARED_SETTINGS
+
+
+class CryptoLabelStyles(NamedTuple):
+    """
+    Стили CryptoLabel, зависящие от настроек шрифта.
+    """
+    price: str  # Основная цена (с цветами трендов)
+    spread_value: str  # Рублевые значения спредов
+
+
+def build_styles(settings: QSettings) -> CryptoLabelStyles:
+    """
+    Собирает стили CryptoLabel по настройкам шрифта.
+    
+    Вызывается один раз на все виджеты, а не в каждом CryptoLabel.
+    
+    Args:
+        settings: Настройки приложения
+        
+    Returns:
+        Готовые стили
+    """
+    font_size = settings.value("ui/font_size", 10, type=int)
+    font_family = settings.value("ui/font", "Segoe UI", type=str)
+    font_style = f"font-family: '{font_family}'; font-size: {font_size}pt; font-weight: bold;"
+    return CryptoLabelStyles(
+        price=_STYLE_PRICE_VALUE_TEMPLATE.format(base_style=f"{font_style} qproperty-alignment: AlignRight;"),
+        spread_value=font_style,
+    )
+
+
+# Шрифты общие для всех CryptoLabel (создаются лениво, после QApplication)
+_FONTS: Optional[Dict[str, QFont]] = None
+
+
+def _get_fonts() -> Dict[str, QFont]:
+    """
+    Возвращает общие для всех CryptoLabel шрифты.
+    
+    Returns:
+        Словарь шрифтов: title, value, label, trend, small
+    """
+    global _FONTS
+    if _FONTS is None:
+        _FONTS = {
+            "title": QFont('Segoe UI', 16, QFont.Bold),
+            "value": QFont('Segoe UI', 18, QFont.Bold),
+            "label": QFont('Segoe UI', 12),
+            "trend": QFont('Segoe UI', 14),
+            "small": QFont('Segoe UI', 9),
+        }
+    return _FONTS
+
+
+class SpreadConfigCache:
+    """
+    Кэш настроек спредов, общий для всех виджетов CryptoLabel.
+    
+    Значения читаются из QSettings один раз и перечитываются только
+    после сигнала об изменении настроек.
+    """
+    
+    percents: Tuple[float, ...] = ()
+    names: List[str] = []
+    dirty = True
+    
+    @classmethod
+    def ensure_loaded(cls):
+        """Читает настройки спредов из QSettings, если кэш устарел."""
+        if not cls.dirty:
+            return
+        
+        settings = _shared_settings()
+        settings.beginGroup("spreads")
+        cls.percents = tuple(
+            settings.value(f"percent{i}", default, type=float)
+            for i, default in enumerate(_DEFAULT_SPREAD_PERCENTS, start=1)
+        )
+        cls.names = [
+            settings.value(f"name{i}", f"Спред {i}", type=str)
+            for i in range(1, len(_DEFAULT_SPREAD_PERCENTS) + 1)
+        ]
+        settings.endGroup()
+        cls.dirty = False
+        logger.debug(f"SpreadConfigCache loaded: percents={cls.percents}, names={cls.names}")
+    
+    @classmethod
+    def invalidate(cls):
+        """Помечает кэш устаревшим; настройки будут перечитаны при следующем обращении."""
+        cls.dirty = True
+
+
+settings_manager.changed.connect(SpreadConfigCache.invalidate)
+
+
+@lru_cache(maxsize=4096)
+def _fmt_rub(cents: int) -> str:
+    """
+    Форматирует рублевую цену, заданную в копейках.
+    
+    Ключ кэша - целое число копеек, поэтому при стабильной цене
+    повторное форматирование сводится к поиску в словаре.
+    
+    Args:
+        cents: Цена в копейках
+        
+    Returns:
+        Отформатированная строка с символом рубля
+    """
+    return format_currency(cents / 100, "₽")
+
+
+@lru_cache(maxsize=1024)
+def _fmt_usd(dollars: int) -> str:
+    """
+    Форматирует спотовую цену в целых долларах.
+    
+    Args:
+        dollars: Цена в долларах, округленная до целого
+        
+    Returns:
+        Отформатированная строка с символом доллара
+    """
+    return f"{dollars:,} $"
+
+
+@lru_cache(maxsize=256)
+def _format_spread_prices(base_rub_price: float, spread_percents: Tuple[float, ...]) -> Tuple[str, ...]:
+    """
+    Форматирует рублевые цены для набора спредов.
+    
+    Args:
+        base_rub_price: Базовая цена в рублях
+        spread_percents: Проценты спредов
+        
+    Returns:
+        Отформатированные цены в том же порядке, что и проценты
+    """
+    return tuple(
+        _fmt_rub(int(round(base_rub_price * (1 + spread_pct / 100) * 100)))
+        for spread_pct in spread_percents
+    )
+
 
 class CryptoLabel(QFrame):
     """
@@ -25,7 +246,8 @@ class CryptoLabel(QFrame):
     # Сигнал, который испускается при нажатии на виджет
     clicked = pyqtSignal()
     
-    def __init__(self, currency: str, exchange: str, parent=None):
+    def __init__(self, currency: str, exchange: str, parent=None,
+                 styles: Optional[CryptoLabelStyles] = None):
         """
         Инициализация виджета CryptoLabel.
         
@@ -33,39 +255,50 @@ class CryptoLabel(QFrame):
             currency: Название криптовалюты (BTC, ETH, USDT)
             exchange: Название биржи
             parent: Родительский виджет
+            styles: Готовые стили (если не переданы, собираются из настроек)
         """
         super().__init__(parent)
         
         self.currency = currency
         self.exchange = exchange
-        self.settings = QSettings()
+        self.settings = _shared_settings()
         self.price = 0.0
         self.spot_price = 0.0  # Цена в USD для BTC/ETH
         self.prev_price = 0.0
         self.trend = 0  # 0 = нет изменений, 1 = рост, -1 = падение
         self._spread_labels = []
+        self._value_labels = []  # Плоский список меток со значениями спредов
         self._price_history = []  # История изменения цены для обнаружения тренда
+        self._has_rendered = False  # Были ли данные уже отрисованы через _update_ui
+        self._trend_state = "flat"  # Текущее значение свойства "trend" у меток
+        
+        # Валюта не меняется, поэтому способ обновления спотовой цены выбирается один раз
+        if self.currency == "USDT":
+            self._update_spot = self._spot_usdt_noop
+        elif self.currency in _FIAT_SPOT:
+            self._update_spot = self._spot_fiat_fmt
+        else:
+            self._update_spot = self._spot_hidden
         
         # Получаем доступ к глобальному AppState
         self.app_state = AppState()
+        self.app_state.signals.priceUpdated.connect(self._on_price_signal)
         
         # Инициализируем таймер для сброса тренда (он уже был)
         self.trend_timer = QTimer(self)
         self.trend_timer.timeout.connect(self._reset_trend)
         self.trend_timer.setSingleShot(True)
         
+        # Стили собираются один раз на все виджеты (см. build_styles)
+        self._styles = styles if styles is not None else build_styles(self.settings)
+        
         # Инициализируем UI
         self._init_ui()
         
-        # Инициализируем и запускаем таймер для обновления UI из AppState
-        self.ui_update_timer = QTimer(self)
-        self.ui_update_timer.timeout.connect(self._update_from_app_state)
-        self.ui_update_timer.start(1000) # Обновляем UI каждую секунду
-        
-        # Вызываем первое обновление сразу, чтобы не ждать секунду
+        # Новые цены приходят сигналом AppState.priceUpdated, а общий такт
+        # главного окна (MainWindow.ui_tick -> InfoWidget.tick) служит резервной синхронизацией.
+        # Вызываем первое обновление сразу, чтобы не ждать сигнала
         self._update_from_app_state()
-        # Применяем начальные визуальные настройки
-        self._apply_visual_settings()
     
     
     def _init_ui(self):
@@ -75,18 +308,13 @@ class CryptoLabel(QFrame):
         self.setMinimumWidth(280) # Установим минимальную ширину, высота будет авто
         self.setMinimumHeight(240) # Устанавливаем минимальную высоту для выравнивания
         self.setObjectName("cryptoWidget")
-        
-        # Добавляем эффект тени
-        shadow = QGraphicsDropShadowEffect(self)
-        shadow.setBlurRadius(12)
-        shadow.setColor(QColor(200, 200, 200, 50))
-        shadow.setOffset(0, 4)
-        self.setGraphicsEffect(shadow)
+        # Тень задается нижней границей в custom.css (QFrame#cryptoWidget)
         
         # Шрифты
-        font_title = QFont('Segoe UI', 16, QFont.Bold)
-        font_value = QFont('Segoe UI', 18, QFont.Bold)
-        font_label = QFont('Segoe UI', 12)
+        fonts = _get_fonts()
+        font_title = fonts["title"]
+        font_value = fonts["value"]
+        font_label = fonts["label"]
         
         # Создаем основной компоновщик
         main_layout = QVBoxLayout(self)
@@ -103,9 +331,10 @@ class CryptoLabel(QFrame):
         top_panel.addWidget(self.currency_label)
         
         # Добавляем индикатор тренда
-        self.trend_label = QLabel("●", self)
-        self.trend_label.setFont(QFont('Segoe UI', 14))
-        self.trend_label.setStyleSheet("color: #FFC107; font-size: 14px; qproperty-alignment: AlignCenter;")
+        self.trend_label = QLabel(_TREND_SYMBOLS[self._trend_state], self)
+        self.trend_label.setFont(fonts["trend"])
+        self.trend_label.setProperty("trend", self._trend_state)
+        self.trend_label.setStyleSheet(_STYLE_TREND_LABEL)
         self.trend_label.setFixedSize(22, 22)
         top_panel.addWidget(self.trend_label)
         
@@ -121,13 +350,7 @@ class CryptoLabel(QFrame):
         # Виджет для текущей цены
         price_widget = QFrame(self)
         price_widget.setObjectName("priceWidget")
-        price_widget.setStyleSheet("""
-            QFrame#priceWidget {
-                background-color: #ffffff;
-                border-radius: 10px;
-                border: 1px solid #efefef;
-            }
-        """)
+        price_widget.setStyleSheet(_STYLE_PRICE_FRAME)
         price_layout = QVBoxLayout(price_widget)
         price_layout.setContentsMargins(12, 12, 12, 12)
         price_layout.setSpacing(6)
@@ -141,7 +364,8 @@ class CryptoLabel(QFrame):
         self.price_value = QLabel("0 ₽", price_widget)
         self.price_value.setObjectName("priceValueLabel")
         self.price_value.setFont(font_value)
-        self.price_value.setStyleSheet("color: #303030; font-weight: bold; qproperty-alignment: AlignRight;")
+        self.price_value.setProperty("trend", self._trend_state)
+        self.price_value.setStyleSheet(self._styles.price)
         self.price_value.setMinimumWidth(150)
         self.price_value.setWordWrap(True)
         price_layout.addWidget(self.price_value)
@@ -149,20 +373,13 @@ class CryptoLabel(QFrame):
         # Цена в долларах (для BTC, ETH) или информация для USDT
         self.spot_price_label = QLabel(price_widget)
         self.spot_price_label.setObjectName("spot_price")
-        # Общий стиль для метки спотовой цены
-        self.spot_price_label.setStyleSheet("""
-            QLabel#spot_price {
-                font-size: 14px; 
-                /* Цвет будет наследоваться от темы */
-                qproperty-alignment: AlignLeft;
-            }
-        """)
+        self.spot_price_label.setStyleSheet(_STYLE_SPOT_PRICE)
         price_layout.addWidget(self.spot_price_label)
         
         if self.currency == "USDT":
             self.spot_price_label.setText("Нет спотовой цены")
             self.spot_price_label.setVisible(True) 
-        elif self.currency in ["BTC", "ETH"]:
+        elif self.currency in _FIAT_SPOT:
             # Текст будет установлен при обновлении. Убедимся, что метка видима.
             self.spot_price_label.setText("- $") # Начальный плейсхолдер
             self.spot_price_label.setVisible(True)
@@ -179,11 +396,11 @@ class CryptoLabel(QFrame):
         # Добавляем таймер для последнего обновления
         update_layout = QHBoxLayout()
         update_label = QLabel("Обновлено:", self)
-        update_label.setFont(QFont('Segoe UI', 9))
+        update_label.setFont(fonts["small"])
         update_label.setStyleSheet("color: #909090;")
         
         self.update_time = QLabel("21:15:09", self)
-        self.update_time.setFont(QFont('Segoe UI', 9))
+        self.update_time.setFont(fonts["small"])
         self.update_time.setStyleSheet("color: #606060; qproperty-alignment: AlignRight;")
         
         update_layout.addWidget(update_label)
@@ -219,13 +436,7 @@ class CryptoLabel(QFrame):
         # Создаем фрейм для спредов
         spread_frame = QFrame(self)
         spread_frame.setObjectName("spreadWidget")
-        spread_frame.setStyleSheet("""
-            QFrame#spreadWidget {
-                background-color: #ffffff;
-                border-radius: 10px;
-                border: 1px solid #efefef;
-            }
-        """)
+        spread_frame.setStyleSheet(_STYLE_SPREAD_FRAME)
         spread_layout = QVBoxLayout(spread_frame)
         spread_layout.setContentsMargins(12, 12, 12, 12)
         spread_layout.setSpacing(6)
@@ -256,7 +467,7 @@ class CryptoLabel(QFrame):
             # Метка со значением спреда в валюте
             value_label = QLabel("0 ₽", spread_frame) # Начинаем с заглушки
             value_label.setFont(font)
-            value_label.setStyleSheet("color: #303030; qproperty-alignment: AlignRight;")
+            value_label.setStyleSheet(self._styles.spread_value)
             
             # Добавляем метки в компоновщик строки
             spread_row.addWidget(name_label)       # Название
@@ -273,17 +484,30 @@ class CryptoLabel(QFrame):
                 "value_label": value_label
             })
         
+        self._value_labels = [d["value_label"] for d in self._spread_labels]
+        
         # Добавляем фрейм спредов в основной компоновщик
         layout.addWidget(spread_frame)
     
-    def update_price(self, price: float, spot_price: Optional[float] = None):
+    def update_price(self, price: float, spot_price: Optional[float] = None,
+                     ts_str: Optional[str] = None):
         """
         Обновление отображаемой цены.
         
         Args:
             price: Новое значение цены в рублях
             spot_price: Цена в долларах (для BTC и ETH)
+            ts_str: Готовая строка времени обновления (формируется один раз на такт)
         """
+        if ts_str is None:
+            ts_str = datetime.now().strftime("%H:%M:%S")
+        
+        # Данные не изменились - обновляем только время, без перерисовки
+        if (self._has_rendered and price == self.price
+                and (spot_price is None or spot_price == self.spot_price)):
+            self.update_time.setText(ts_str)
+            return
+        
         self.prev_price = self.price
         self.price = price
         
@@ -300,32 +524,21 @@ class CryptoLabel(QFrame):
         self._update_ui()
         
         # Обновляем время последнего обновления
-        current_time = datetime.now().strftime("%H:%M:%S")
-        self.update_time.setText(current_time)
+        self.update_time.setText(ts_str)
         
         # Запускаем таймер для сброса иконки тренда
         self._start_trend_timer()
     
     def _update_ui(self):
         """Обновление всех элементов UI на основе текущих данных."""
+        self._has_rendered = True
         # Обновляем основную цену
-        logger.debug(f"CryptoLabel {self.currency}/{self.exchange}: Updating UI. Price value: {self.price}, type: {type(self.price)}")
-        formatted_price = format_currency(self.price, "₽") 
+        logger.debug("CryptoLabel %s/%s: Updating UI. Price value: %s", self.currency, self.exchange, self.price)
+        formatted_price = _fmt_rub(int(round(self.price * 100)))
         self.price_value.setText(formatted_price)
         
         # Обновляем спотовую цену или информационное сообщение
-        if self.currency == "USDT":
-            # Текст "Нет спотовой цены" уже установлен в _init_ui и не должен меняться здесь
-            self.spot_price_label.setVisible(True) # Просто убедимся, что видимо
-        elif self.currency in ["BTC", "ETH"]:
-            if self.spot_price > 0:
-                self.spot_price_label.setText(f"{self.spot_price:,.0f} $")
-            else:
-                self.spot_price_label.setText("- $") # Плейсхолдер, если спот цена невалидна или 0
-            self.spot_price_label.setVisible(True)
-        else:
-            # Для других валют (если появятся), метка будет скрыта (согласно _init_ui)
-            self.spot_price_label.setVisible(False) 
+        self._update_spot()
         
         # Обновляем иконку тренда
         self._update_trend_icon()
@@ -336,31 +549,35 @@ class CryptoLabel(QFrame):
         # Обновляем размер всего виджета после обновления контента
         # self.adjustSize() # Убираем adjustSize, компоновщик должен справиться сам
     
+    def _spot_usdt_noop(self):
+        """Спотовая цена USDT: текст "Нет спотовой цены" задан в _init_ui."""
+    
+    def _spot_fiat_fmt(self):
+        """Спотовая цена BTC/ETH в долларах."""
+        if self.spot_price > 0:
+            self.spot_price_label.setText(_fmt_usd(int(round(self.spot_price))))
+        else:
+            self.spot_price_label.setText("- $") # Плейсхолдер, если спот цена невалидна или 0
+    
+    def _spot_hidden(self):
+        """Для других валют (если появятся) метка скрыта (согласно _init_ui)."""
+    
     def _update_trend_icon(self):
         """Обновление иконки тренда и цвета цены в зависимости от изменения цены."""
-        # Сначала применяем актуальные настройки шрифта (размер, семейство)
-        # Это гарантирует, что цвет не перезапишет нужный шрифт
-        # (Дублирует часть логики _apply_visual_settings, но обеспечивает надежность)
-        font_size = self.settings.value("ui/font_size", 10, type=int)
-        font_family = self.settings.value("ui/font", "Segoe UI", type=str)
-        base_style = f"font-family: '{font_family}'; font-size: {font_size}pt; font-weight: bold; qproperty-alignment: AlignRight;"
-
-        if self.trend > 0:
-            # Тренд вверх - зеленая индикация
-            self.trend_label.setText("▲")
-            self.trend_label.setStyleSheet("color: #4CAF50; font-size: 14px; font-weight: bold; qproperty-alignment: AlignCenter;")
-            self.price_value.setStyleSheet(f"color: #4CAF50; {base_style}") # Комбинируем цвет и базовый стиль
-        elif self.trend < 0:
-            # Тренд вниз - красная индикация
-            self.trend_label.setText("▼")
-            self.trend_label.setStyleSheet("color: #F44336; font-size: 14px; font-weight: bold; qproperty-alignment: AlignCenter;")
-            self.price_value.setStyleSheet(f"color: #F44336; {base_style}") # Комбинируем цвет и базовый стиль
-        else:
-            # Нет тренда - нейтральная индикация
-            self.trend_label.setText("●")
-            self.trend_label.setStyleSheet("color: #FFC107; font-size: 14px; qproperty-alignment: AlignCenter;")
-            # Используем цвет по умолчанию (из темы/родителя) или задаем явно (#303030)
-            self.price_value.setStyleSheet(f"color: #303030; {base_style}") # Комбинируем цвет и базовый стиль
+        # up - зеленая индикация, down - красная, flat - нейтральная
+        trend_state = _TREND_STATES[self.trend]
+        
+        if trend_state == self._trend_state:
+            return
+        self._trend_state = trend_state
+        
+        self.trend_label.setText(_TREND_SYMBOLS[trend_state])
+        for label in (self.trend_label, self.price_value):
+            # Стиль уже содержит цвета всех трендов - меняем только свойство
+            label.setProperty("trend", trend_state)
+            style = label.style()
+            style.unpolish(label)
+            style.polish(label)
     
     def _update_spreads(self):
         """Обновление значений спредов на основе настроек."""
@@ -369,22 +586,15 @@ class CryptoLabel(QFrame):
         
         base_rub_price = self.price 
 
-        # Получаем настроенные проценты спреда из QSettings
-        spread_pct1 = self.settings.value("spreads/percent1", 0.50, type=float)
-        spread_pct2 = self.settings.value("spreads/percent2", 1.00, type=float)
-        spread_pct3 = self.settings.value("spreads/percent3", 1.50, type=float)
-        logger.debug(f"CryptoLabel {self.currency}/{self.exchange}: Loaded spread_pcts from QSettings: {spread_pct1}%, {spread_pct2}%, {spread_pct3}%")
-        
-        # Получаем настроенные названия спреда из QSettings
-        spread_name1 = self.settings.value("spreads/name1", "Спред 1", type=str)
-        spread_name2 = self.settings.value("spreads/name2", "Спред 2", type=str)
-        spread_name3 = self.settings.value("spreads/name3", "Спред 3", type=str)
-        logger.debug(f"CryptoLabel {self.currency}/{self.exchange}: Loaded spread names from QSettings: '{spread_name1}', '{spread_name2}', '{spread_name3}'")
-
-        configured_spread_percents = [spread_pct1, spread_pct2, spread_pct3]
-        configured_spread_names = [spread_name1, spread_name2, spread_name3]
-        logger.debug(f"CryptoLabel {self.currency}/{self.exchange}: configured_spread_percents list: {configured_spread_percents}")
-        logger.debug(f"CryptoLabel {self.currency}/{self.exchange}: configured_spread_names list: {configured_spread_names}")
+        # Получаем настроенные проценты и названия спредов из общего кэша
+        SpreadConfigCache.ensure_loaded()
+        configured_spread_percents = SpreadConfigCache.percents
+        configured_spread_names = SpreadConfigCache.names
+        logger.debug("CryptoLabel %s/%s: configured spreads: percents=%s, names=%s",
+                     self.currency, self.exchange, configured_spread_percents, configured_spread_names)
+        
+        # Одинаковые цена и проценты дают одинаковые строки - берем их из кэша
+        formatted_net_prices = _format_spread_prices(base_rub_price, configured_spread_percents)
 
         for idx, labels_dict in enumerate(self._spread_labels):
             name_label = labels_dict['name_label']
@@ -394,22 +604,17 @@ class CryptoLabel(QFrame):
             if idx < len(configured_spread_percents):
                 spread_pct = configured_spread_percents[idx]
                 spread_name = configured_spread_names[idx] if idx < len(configured_spread_names) else f"Спред {idx+1}" # Имя по умолчанию, если что-то пошло не так
-                
-                logger.debug(f"CryptoLabel {self.currency}/{self.exchange}: Spread_UI_element {idx+1} using name '{spread_name}' and percent {spread_pct}%")
+                formatted_net_price = formatted_net_prices[idx]
             else:
                 spread_pct = 0 
                 spread_name = f"Спред {idx+1}"
-                logger.warning(f"CryptoLabel {self.currency}/{self.exchange}: Spread_UI_element {idx+1} has no configured percent, using 0%.")
+                formatted_net_price = _fmt_rub(int(round(base_rub_price * 100)))
+                logger.warning("CryptoLabel %s/%s: Spread_UI_element %d has no configured percent, using 0%%.",
+                               self.currency, self.exchange, idx + 1)
             
             # Обновляем все три метки
             name_label.setText(f"{spread_name}:")
             pct_label.setText(f"{spread_pct:.2f}%")
-            
-            raw_net_price_rub = base_rub_price * (1 + (spread_pct) / 100)
-            # Добавим лог для расчета рублевой цены спреда
-            logger.debug(f"CryptoLabel {self.currency}/{self.exchange}: Spread_UI_element {idx+1} - base_rub_price: {base_rub_price}, spread_pct: {spread_pct}, commission: {commission}, raw_net_price_rub: {raw_net_price_rub}")
-            formatted_net_price = format_currency(raw_net_price_rub, "₽")
-
             value_label.setText(formatted_net_price)
     
     def hideContents(self):
@@ -417,16 +622,9 @@ class CryptoLabel(QFrame):
         self.price_value.setText("")
         if hasattr(self, 'spot_price_label'):
             self.spot_price_label.setText("")
-        if self.currency in ["BTC", "ETH"]:
-            for _, value_label in self._spread_labels:
-                value_label.setText("")
-        self.setStyleSheet("""
-            QFrame#cryptoWidget {
-                background-color: rgba(255, 255, 255, 0.5);
-                border-radius: 12px;
-                border: 1px solid #efefef;
-            }
-        """)
+        for value_label in self._value_labels:
+            value_label.setText("")
+        self.setStyleSheet(_STYLE_HIDDEN_CONTENTS)
     
     def showContents(self):
         """Показать содержимое виджета."""
@@ -448,61 +646,46 @@ class CryptoLabel(QFrame):
         self.clicked.emit()
         super().mousePressEvent(event)
 
+    def _on_price_signal(self, exchange: str, currency: str, price: float,
+                         spot_price: Optional[float]):
+        """
+        Обработка сигнала AppState.priceUpdated.
+        
+        Args:
+            exchange: Название биржи
+            currency: Название криптовалюты
+            price: Цена в рублях
+            spot_price: Цена в долларах (опционально)
+        """
+        if exchange == self.exchange and currency == self.currency:
+            self.update_price(price=price, spot_price=spot_price)
+    
     # НОВЫЙ МЕТОД для обновления из AppState
-    def _update_from_app_state(self):
-        """Обновляет UI виджета на основе данных из глобального AppState."""
-        exchange_data = self.app_state.get_exchange(self.exchange)
-        if exchange_data:
-            asset_data = exchange_data.get_asset(self.currency)
-            if asset_data:
-                # logger.debug(f"Updating {self.exchange}-{self.currency} from AppState: RUB={asset_data.base_price}, SPOT={asset_data.spot_price}")
-                # Вызываем существующий метод update_price с данными из AppState
-                # Передаем base_price как 'price' и spot_price как 'spot_price'
-                self.update_price(price=asset_data.base_price, spot_price=asset_data.spot_price)
-            else:
-                # Если данных по активу еще нет, можно показать заглушку или ничего не делать
-                # logger.debug(f"No asset data in AppState for {self.exchange}-{self.currency}")
-                pass 
-        else:
-            # Если данных по бирже еще нет
-            # logger.debug(f"No exchange data in AppState for {self.exchange}")
-            pass 
+    def _update_from_app_state(self, ts_str: Optional[str] = None):
+        """
+        Обновляет UI виджета на основе данных из глобального AppState.
+        
+        Args:
+            ts_str: Строка времени текущего такта (опционально)
+        """
+        asset_data = self.app_state.get_asset(self.exchange, self.currency)
+        if asset_data:
+            # Передаем base_price как 'price' и spot_price как 'spot_price'
+            self.update_price(price=asset_data.base_price, spot_price=asset_data.spot_price,
+                              ts_str=ts_str)
 
+    def set_styles(self, styles: CryptoLabelStyles):
+        """
+        Устанавливает новые стили и применяет их.
+        
+        Args:
+            styles: Стили, собранные build_styles
+        """
+        self._styles = styles
+        self._apply_visual_settings()
+    
     def _apply_visual_settings(self):
-        """Применяет настройки шрифта к нужным элементам через setStyleSheet."""
-        logger.debug(f"CryptoLabel {self.currency}/{self.exchange}: Applying visual settings via CSS...")
-        try:
-            font_size = self.settings.value("ui/font_size", 10, type=int)
-            font_family = self.settings.value("ui/font", "Segoe UI", type=str)
-            logger.debug(f"CryptoLabel {self.currency}/{self.exchange}: Using font: {font_family}, size: {font_size}pt for CSS")
-
-            # Стиль для основной цены (жирный шрифт)
-            price_value_style = f"font-family: '{font_family}'; font-size: {font_size}pt; font-weight: bold;"
-            # Стиль для значений спредов (обычный шрифт, если нужно)
-            # Пока оставим жирным, как и основную цену для единообразия
-            spread_value_style = price_value_style 
-
-            # Применяем к основной цене
-            if hasattr(self, 'price_value'):
-                # Важно: Сохраняем текущий цвет, чтобы не перезаписать его
-                current_color = self.price_value.palette().color(QPalette.ColorRole.WindowText).name()
-                self.price_value.setStyleSheet(f"color: {current_color}; {price_value_style}")
-                logger.debug(f"CryptoLabel {self.currency}/{self.exchange}: Applied CSS font to price_value.")
-            else:
-                logger.warning(f"CryptoLabel {self.currency}/{self.exchange}: price_value not found during CSS font apply.")
-
-            # Применяем к рублевым значениям спредов
-            if hasattr(self, '_spread_labels'):
-                for idx, labels_dict in enumerate(self._spread_labels):
-                    value_label = labels_dict.get('value_label')
-                    if value_label:
-                        # Устанавливаем стиль, цвет по умолчанию будет черным (#303030), что нас устраивает
-                        value_label.setStyleSheet(spread_value_style)
-                        logger.debug(f"CryptoLabel {self.currency}/{self.exchange}: Applied CSS font to spread value_label {idx+1}.")
-                    else:
-                        logger.warning(f"CryptoLabel {self.currency}/{self.exchange}: value_label not found for spread {idx+1}.")
-            else:
-                 logger.warning(f"CryptoLabel {self.currency}/{self.exchange}: _spread_labels not found during CSS font apply.")
-
-        except Exception as e:
-            logger.error(f"CryptoLabel {self.currency}/{self.exchange}: Error applying visual settings via CSS: {e}")
\ No newline at end of file
+        """Применяет стили шрифта к основной цене и значениям спредов."""
+        self.price_value.setStyleSheet(self._styles.price)
+        for value_label in self._value_labels:
+            value_label.setStyleSheet(self._styles.spread_value)
@@ -3,9 +3,12 @@ from typing import Optional
 from PyQt5.QtCore import Qt
 from PyQt5.QtGui import QFont
 from PyQt5.QtWidgets import (
-    QWidget, QVBoxLayout, QHBoxLayout, QLabel, QFrame, QGraphicsDropShadowEffect
+    QWidget, QVBoxLayout, QHBoxLayout, QLabel, QFrame
 )
-from PyQt5.QtGui import QColor
+
+
+# Прозрачный фон контейнера содержимого
+_STYLE_CONTENT_CONTAINER = "background: transparent;"
 
 
 class ExchangeWidget(QFrame):
@@ -13,6 +16,9 @@ class ExchangeWidget(QFrame):
     Виджет для отображения информации о бирже и её криптовалютах.
     """
     
+    # Шрифт заголовка общий для всех экземпляров (создается при первом использовании)
+    _HEADER_FONT: Optional[QFont] = None
+    
     def __init__(self, title: str, parent: Optional[QWidget] = None):
         """
         Инициализация виджета биржи.
@@ -23,17 +29,12 @@ class ExchangeWidget(QFrame):
         """
         super().__init__(parent)
         self.title = title
+        self._snapshot_label: Optional[QLabel] = None  # Снимок содержимого на время прокрутки
         
         # Настройка внешнего вида
         self.setObjectName("exchangeWidget")
         self.setFrameShape(QFrame.NoFrame)
-        
-        # Добавляем эффект тени
-        shadow = QGraphicsDropShadowEffect(self)
-        shadow.setBlurRadius(10)
-        shadow.setColor(QColor(200, 200, 200, 50))
-        shadow.setOffset(0, 4)
-        self.setGraphicsEffect(shadow)
+        # Тень задается нижней границей в custom.css (QFrame#exchangeWidget)
         
         # Создаем и инициализируем интерфейс
         self._init_ui()
@@ -47,17 +48,45 @@ class ExchangeWidget(QFrame):
         
         # Заголовок биржи
         header = QLabel(self.title, self)
-        header.setFont(QFont("Segoe UI", 16, QFont.Bold))
+        if ExchangeWidget._HEADER_FONT is None:
+            ExchangeWidget._HEADER_FONT = QFont("Segoe UI", 16, QFont.Bold)
+        header.setFont(ExchangeWidget._HEADER_FONT)
         header.setAlignment(Qt.AlignmentFlag.AlignCenter)
         # header.setStyleSheet("color: #303030;") # Убираем жесткий цвет, будет наследоваться из CSS
         main_layout.addWidget(header)
         
         # Создаем контейнер для содержимого
         content_container = QWidget(self)
-        content_container.setStyleSheet("background: transparent;")
+        content_container.setStyleSheet(_STYLE_CONTENT_CONTAINER)
+        # Скрытый на время прокрутки контейнер сохраняет свое место в макете
+        size_policy = content_container.sizePolicy()
+        size_policy.setRetainSizeWhenHidden(True)
+        content_container.setSizePolicy(size_policy)
+        self.content_container = content_container
         self.content_layout = QVBoxLayout(content_container)
         self.content_layout.setContentsMargins(0, 0, 0, 0)
         self.content_layout.setSpacing(16)
         
         # Добавляем контейнер содержимого в основной макет
-        main_layout.addWidget(content_container) 
\ No newline at end of file
+        main_layout.addWidget(content_container)
+    
+    def show_snapshot(self):
+        """
+        Заменяет живое содержимое его снимком.
+        
+        На время прокрутки рисуется одна картинка вместо всех CryptoLabel.
+        """
+        if self._snapshot_label is None:
+            self._snapshot_label = QLabel(self)
+            self._snapshot_label.setAttribute(Qt.WA_TransparentForMouseEvents, True)
+        self._snapshot_label.setGeometry(self.content_container.geometry())
+        self._snapshot_label.setPixmap(self.content_container.grab())
+        self._snapshot_label.show()
+        self._snapshot_label.raise_()
+        self.content_container.hide()
+    
+    def show_live(self):
+        """Возвращает живое содержимое вместо снимка."""
+        self.content_container.show()
+        if self._snapshot_label is not None:
+            self._snapshot_label.hide() 
\ No newline at end of file
@@ -2,33 +2,88 @@
 Виджет для отображения информации о биржах и криптовалютах.
 """
 import logging
-from typing import Dict, List, Optional, Union, cast
+from typing import Dict, List, NamedTuple, Optional, Tuple
 from PyQt5.QtCore import QSettings, Qt, QTimer
 from PyQt5.QtWidgets import QWidget, QGridLayout, QLabel, QHBoxLayout, QVBoxLayout, QScrollArea, QFrame
 from PyQt5.QtGui import QFont
 from collections import defaultdict
 
-from core.app_state import app_state
-from core.models import AssetPrice
-from config import APP_SETTINGS
-from ui.widgets.crypto_label import CryptoLabel
+from ui.dialogs.settings_dialog import settings_manager
+from ui.widgets.crypto_label import CryptoLabel, build_styles
 from ui.widgets.exchange_widget import ExchangeWidget
 
 logger = logging.getLogger(__name__)
 
+# Стили задаются модульными константами и привязаны к objectName виджетов
+_STYLE_SCROLL_AREA = "QScrollArea#infoWidgetScrollArea { background-color: transparent; border: none; }"
+_STYLE_TITLE = "QLabel#mainTitle { color: #303030; }"
+
+
+class ExchangeSpec(NamedTuple):
+    """
+    Описание биржи для InfoWidget.
+    """
+    name: str  # Отображаемое название
+    key: str  # Ключ биржи
+    assets: Tuple[str, ...]  # Отображаемые активы
+
+
+_EXCHANGES: Tuple[ExchangeSpec, ...] = (
+    ExchangeSpec("BINANCE", "binance", ("BTC", "ETH", "USDT")),
+    ExchangeSpec("BYBIT", "bybit", ("BTC", "ETH", "USDT")),
+    ExchangeSpec("COMMEX", "commex", ("BTC", "ETH", "USDT")),
+    ExchangeSpec("GARANTEX", "garantex", ("BTC", "ETH", "USDT")),
+)
+
+# Приблизительная высота заглушки до создания первой биржи. Точность не важна:
+# после каждого создания заглушки принимают фактический sizeHint биржи,
+# и проверка пересечения с областью просмотра повторяется
+_PLACEHOLDER_HEIGHT = 430
+
 
 class InfoWidget(QWidget):
     """
     Виджет для отображения информации о курсах криптовалют.
     """
     
+    # Шрифт заголовка общий для всех экземпляров (создается при первом использовании)
+    _TITLE_FONT: Optional[QFont] = None
+    
     def __init__(self, parent=None):
         """Инициализация виджета информации."""
         super().__init__(parent)
         self.parent_widget = parent  # Переименовано, чтобы избежать конфликта с методом parent()
-        self.exchange_widgets = defaultdict(dict)
+        # CryptoLabel по ключу (биржа, актив)
+        self.exchange_widgets: Dict[Tuple[str, str], CryptoLabel] = {}
         self.exchange_widget_refs = {}
+        # Плоский список всех созданных CryptoLabel
+        self._all_labels: List[CryptoLabel] = []
+        # Биржи, виджеты которых еще не созданы: ключ -> (название, активы, заглушка)
+        self._pending = {}
+        # Видимость активов, запрошенная до создания виджета биржи
+        self._pending_asset_visibility = defaultdict(dict)
+        # Стили CryptoLabel собираются один раз для всех виджетов
+        self._label_styles = build_styles(QSettings())
+        
+        # Изменения видимости копятся и применяются одним пакетом на следующем
+        # проходе цикла событий: (биржа, None) - биржа, (биржа, актив) - актив
+        self._pending_vis: Dict[Tuple[str, Optional[str]], bool] = {}
+        self._vis_timer = QTimer(self)
+        self._vis_timer.setSingleShot(True)
+        self._vis_timer.setInterval(0)
+        self._vis_timer.timeout.connect(self._flush_vis)
+        
+        # Создание бирж, попавших в область просмотра, откладывается до
+        # раскладки макета, чтобы геометрия заглушек была актуальной
+        self._materialize_timer = QTimer(self)
+        self._materialize_timer.setSingleShot(True)
+        self._materialize_timer.setInterval(0)
+        self._materialize_timer.timeout.connect(self._materialize_visible)
+        
         self._init_ui()
+        
+        # Сохраненные настройки (OK или Apply) сразу применяются ко всем CryptoLabel
+        settings_manager.changed.connect(self.apply_visual_settings_bulk)
     
     def _init_ui(self):
         """Инициализация интерфейса."""
@@ -47,8 +102,10 @@ class InfoWidget(QWidget):
         
         title = QLabel("Криптовалютные торговые пары", title_container)
         title.setObjectName("mainTitle")
-        title.setFont(QFont("Segoe UI", 18, QFont.Bold))
-        title.setStyleSheet("color: #303030;")
+        if InfoWidget._TITLE_FONT is None:
+            InfoWidget._TITLE_FONT = QFont("Segoe UI", 18, QFont.Bold)
+        title.setFont(InfoWidget._TITLE_FONT)
+        title.setStyleSheet(_STYLE_TITLE)
         title_layout.addWidget(title)
         
         main_layout.addWidget(title_container)
@@ -58,13 +115,12 @@ class InfoWidget(QWidget):
         scroll_area.setWidgetResizable(True)
         scroll_area.setFrameShape(QFrame.NoFrame)
         scroll_area.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
-        scroll_area.setStyleSheet("""                
-            QScrollArea {
-                background-color: transparent;
-                border: none;
-            }
-        """)
         scroll_area.setObjectName("infoWidgetScrollArea")
+        scroll_area.setStyleSheet(_STYLE_SCROLL_AREA)
+        self._scroll_area = scroll_area
+        # При изменении размера перерисовываются только открывшиеся области.
+        # WA_OpaquePaintEvent не ставим: фон прозрачный, и без заливки остались бы артефакты
+        scroll_area.viewport().setAttribute(Qt.WA_StaticContents, True)
         
         # Создаем контейнер для содержимого
         content_widget = QWidget(scroll_area)
@@ -74,35 +130,114 @@ class InfoWidget(QWidget):
         content_layout.setContentsMargins(5, 5, 5, 5)
         content_layout.setSpacing(12)
         
-        # Создаем виджеты для каждой биржи
-        self._create_exchange_widgets(content_layout)
+        # Создаем виджеты для каждой биржи (без перерисовки до конца сборки)
+        self.setUpdatesEnabled(False)
+        try:
+            self._create_exchange_widgets(content_layout)
+        finally:
+            self.setUpdatesEnabled(True)
         
         # Устанавливаем виджет содержимого в область прокрутки
         scroll_area.setWidget(content_widget)
         main_layout.addWidget(scroll_area)
+        
+        # Заглушки, попавшие в область просмотра при прокрутке, заменяются виджетами
+        scroll_area.verticalScrollBar().valueChanged.connect(self._materialize_visible)
+        
+        # Во время прокрутки видимые биржи рисуются снимками; живые виджеты
+        # возвращаются, когда прокрутка стихла на 120 мс
+        self._snapshot_widgets: List[ExchangeWidget] = []
+        self._scroll_idle_timer = QTimer(self)
+        self._scroll_idle_timer.setSingleShot(True)
+        self._scroll_idle_timer.setInterval(120)
+        self._scroll_idle_timer.timeout.connect(self._restore_live)
+        scroll_area.verticalScrollBar().valueChanged.connect(self._on_scroll_active)
     
     def _create_exchange_widgets(self, layout):
         """
-        Создание виджетов для каждой биржи.
+        Создание заглушек для каждой биржи.
+        
+        Виджет биржи создается, когда его видимая заглушка пересекает область
+        просмотра (см. _materialize_visible), поэтому скрытые в настройках и
+        не прокрученные до биржи не создают свои CryptoLabel.
         
         Args:
             layout: Компоновщик для добавления виджетов
         """
-        # Создаем виджеты для бирж
-        exchanges = [
-            {"name": "BINANCE", "key": "binance", "assets": ["BTC", "ETH", "USDT"]},
-            {"name": "BYBIT", "key": "bybit", "assets": ["BTC", "ETH", "USDT"]},
-            {"name": "COMMEX", "key": "commex", "assets": ["BTC", "ETH", "USDT"]},
-            {"name": "GARANTEX", "key": "garantex", "assets": ["BTC", "ETH", "USDT"]}
-        ]
-        
-        for exchange in exchanges:
-            exchange_widget = self._create_exchange_widget(
-                exchange["name"], 
-                exchange["key"], 
-                exchange["assets"]
-            )
-            layout.addWidget(exchange_widget)
+        self._content_layout = layout
+        
+        content_widget = layout.parentWidget()
+        for spec in _EXCHANGES:
+            placeholder = QWidget(content_widget)
+            placeholder.setFixedHeight(_PLACEHOLDER_HEIGHT)
+            self._pending[spec.key] = (spec.name, spec.assets, placeholder)
+            layout.addWidget(placeholder)
+    
+    def _materialize(self, key: str):
+        """
+        Создает виджет биржи на месте ее заглушки.
+        
+        Args:
+            key: Ключ биржи
+        """
+        title, assets, placeholder = self._pending.pop(key)
+        exchange_widget = self._create_exchange_widget(title, key, assets)
+        self._content_layout.replaceWidget(placeholder, exchange_widget)
+        placeholder.deleteLater()
+        
+        # Оставшиеся заглушки принимают высоту созданной биржи, чтобы при
+        # следующих созданиях диапазон прокрутки и содержимое не смещались
+        height = exchange_widget.sizeHint().height()
+        for _, _, other_placeholder in self._pending.values():
+            other_placeholder.setFixedHeight(height)
+        
+        # Применяем видимость активов, запрошенную до создания виджета
+        for asset_name, visible in self._pending_asset_visibility.pop(key, {}).items():
+            self._apply_asset_visibility(key, asset_name, visible)
+    
+    def _materialize_visible(self):
+        """Создает виджеты бирж, заглушки которых видны в области прокрутки."""
+        # Сначала применяем отложенную видимость, чтобы не создавать скрываемые биржи
+        if self._vis_timer.isActive():
+            self._vis_timer.stop()
+            self._flush_vis()
+        if not self._pending:
+            return
+        # Раскладываем макет сейчас, чтобы заглушки стояли на своих местах
+        self._content_layout.activate()
+        materialized = False
+        for key, (_, _, placeholder) in list(self._pending.items()):
+            if not placeholder.isHidden() and not placeholder.visibleRegion().isEmpty():
+                self._materialize(key)
+                materialized = True
+        # Высота заглушек изменилась - в область просмотра могли попасть новые
+        if materialized:
+            self._materialize_timer.start()
+    
+    def _on_scroll_active(self):
+        """Подменяет видимые биржи снимками в начале прокрутки."""
+        if not self._scroll_idle_timer.isActive():
+            for exchange_widget in self.exchange_widget_refs.values():
+                if exchange_widget.isVisible() and not exchange_widget.visibleRegion().isEmpty():
+                    exchange_widget.show_snapshot()
+                    self._snapshot_widgets.append(exchange_widget)
+        self._scroll_idle_timer.start()
+    
+    def _restore_live(self):
+        """Возвращает живые виджеты после окончания прокрутки."""
+        for exchange_widget in self._snapshot_widgets:
+            exchange_widget.show_live()
+        self._snapshot_widgets.clear()
+    
+    def showEvent(self, event):
+        """Обработка показа виджета: создаем биржи, видимые без прокрутки."""
+        super().showEvent(event)
+        self._materialize_visible()
+    
+    def resizeEvent(self, event):
+        """Обработка изменения размера: в область просмотра могли попасть заглушки."""
+        super().resizeEvent(event)
+        self._materialize_timer.start()
     
     def _create_exchange_widget(self, title, key, assets):
         """
@@ -116,44 +251,104 @@ class InfoWidget(QWidget):
         Returns:
             Виджет биржи
         """
+        key = key.lower()  # Ключ приводится к нижнему регистру один раз
         exchange_widget = ExchangeWidget(title=title, parent=self)
         
         # Сохраняем ссылку на созданный виджет биржи
-        self.exchange_widget_refs[key.lower()] = exchange_widget
+        self.exchange_widget_refs[key] = exchange_widget
         
-        # Создаем grid layout для виджетов криптовалют
-        grid = QGridLayout()
+        # Для одного ряда (до 3 активов) хватает QHBoxLayout, сетка нужна только для нескольких рядов
+        single_row = len(assets) <= 3
+        if single_row:
+            grid = QHBoxLayout()
+            grid.setSpacing(15)
+        else:
+            grid = QGridLayout()
+            grid.setHorizontalSpacing(15)
+            grid.setVerticalSpacing(12)
         grid.setContentsMargins(10, 8, 10, 10)
-        grid.setHorizontalSpacing(15)
-        grid.setVerticalSpacing(12)
-        
-        # Добавляем виджеты криптовалют в сетку
-        for i, asset in enumerate(assets):
-            crypto_widget = CryptoLabel(
-                currency=asset,
-                exchange=key.lower(),
-                parent=exchange_widget
-            )
-            # Сохраняем ссылку на виджет для последующего обновления
-            self.exchange_widgets[key.lower()][asset] = crypto_widget
-            
-            # Добавляем виджет в сетку (по 3 виджета в ряд)
-            grid.addWidget(crypto_widget, i // 3, i % 3)
         
-        # Добавляем сетку в макет биржи
-        exchange_widget.content_layout.addLayout(grid)
+        # Сетка собирается целиком и добавляется в макет биржи одним вызовом
+        exchange_widget.setUpdatesEnabled(False)
+        try:
+            # Первый проход: создаем все CryptoLabel биржи
+            crypto_widgets = [
+                CryptoLabel(currency=asset, exchange=key, parent=exchange_widget, styles=self._label_styles)
+                for asset in assets
+            ]
+            
+            # Второй проход: регистрируем виджеты и раскладываем их по макету
+            for i, (asset, crypto_widget) in enumerate(zip(assets, crypto_widgets)):
+                # Сохраняем ссылку на виджет для последующего обновления
+                self.exchange_widgets[(key, asset)] = crypto_widget
+            
+                # Добавляем виджет в ряд или в сетку (по 3 виджета в ряд)
+                if single_row:
+                    grid.addWidget(crypto_widget)
+                else:
+                    grid.addWidget(crypto_widget, i // 3, i % 3)
+            self._all_labels.extend(crypto_widgets)
+            
+            # Добавляем сетку в макет биржи
+            exchange_widget.content_layout.addLayout(grid)
+        finally:
+            exchange_widget.setUpdatesEnabled(True)
         
         return exchange_widget
     
     def set_exchange_visibility(self, exchange_name: str, visible: bool):
         """
-        Установка видимости биржи.
+        Установка видимости биржи (применяется пакетом в _flush_vis).
+        
+        Args:
+            exchange_name: Название биржи
+            visible: Флаг видимости
+        """
+        self._pending_vis[(exchange_name, None)] = visible
+        self._vis_timer.start()
+    
+    def set_asset_visibility(self, exchange_name: str, asset_name: str, visible: bool):
+        """
+        Установка видимости криптовалюты (применяется пакетом в _flush_vis).
+        
+        Args:
+            exchange_name: Название биржи
+            asset_name: Название криптовалюты
+            visible: Флаг видимости
+        """
+        self._pending_vis[(exchange_name, asset_name)] = visible
+        self._vis_timer.start()
+    
+    def _flush_vis(self):
+        """Применяет накопленные изменения видимости за один проход."""
+        pending_vis, self._pending_vis = self._pending_vis, {}
+        self.setUpdatesEnabled(False)
+        try:
+            for (exchange_name, asset_name), visible in pending_vis.items():
+                if asset_name is None:
+                    self._apply_exchange_visibility(exchange_name, visible)
+                else:
+                    self._apply_asset_visibility(exchange_name, asset_name, visible)
+        finally:
+            self.setUpdatesEnabled(True)
+    
+    def _apply_exchange_visibility(self, exchange_name: str, visible: bool):
+        """
+        Применение видимости биржи.
         
         Args:
             exchange_name: Название биржи
             visible: Флаг видимости
         """
         logger.info(f"Attempting to set visibility for exchange '{exchange_name}' to {visible}")
+        pending = self._pending.get(exchange_name)
+        if pending is not None:
+            # Показывается только заглушка; виджет создается, когда она
+            # попадет в область просмотра
+            pending[2].setVisible(visible)
+            if visible:
+                self._materialize_timer.start()
+            return
         try:
             # Получаем виджет биржи напрямую из словаря ссылок
             exchange_widget_instance = self.exchange_widget_refs.get(exchange_name)
@@ -166,32 +361,63 @@ class InfoWidget(QWidget):
         except Exception as e: # Добавим общий Exception на всякий случай
             logger.error(f"Error setting visibility for exchange '{exchange_name}': {e}")
     
-    def set_asset_visibility(self, exchange_name: str, asset_name: str, visible: bool):
+    def _apply_asset_visibility(self, exchange_name: str, asset_name: str, visible: bool):
         """
-        Установка видимости криптовалюты.
+        Применение видимости криптовалюты.
         
         Args:
             exchange_name: Название биржи
             asset_name: Название криптовалюты
             visible: Флаг видимости
         """
+        if exchange_name in self._pending:
+            # Виджет биржи еще не создан - применим видимость при создании
+            self._pending_asset_visibility[exchange_name][asset_name] = visible
+            return
+        crypto_widget = self.exchange_widgets.get((exchange_name, asset_name))
+        if crypto_widget is None:
+            logger.error("Не найден виджет для %s/%s", exchange_name, asset_name)
+            return
+        crypto_widget.setVisible(visible)
+    
+    def tick(self, ts_str: str):
+        """
+        Резервная синхронизация всех CryptoLabel с AppState по общему такту.
+        
+        Перерисовка отключается на время обхода, чтобы изменения всех
+        меток отрисовались одним проходом.
+        
+        Args:
+            ts_str: Строка времени текущего такта
+        """
+        self.setUpdatesEnabled(False)
         try:
-            crypto_widget = self.exchange_widgets[exchange_name][asset_name]
-            crypto_widget.setVisible(visible)
-        except KeyError:
-            logger.error(f"Не найден виджет для {exchange_name}/{asset_name}")
+            for label in self._all_labels:
+                label._update_from_app_state(ts_str)
+        finally:
+            self.setUpdatesEnabled(True)
     
     # Новый метод для получения всех CryptoLabel
     def get_crypto_labels(self) -> List[CryptoLabel]:
-        """Возвращает список всех виджетов CryptoLabel."""
-        all_labels = []
-        for exchange_assets in self.exchange_widgets.values():
-            all_labels.extend(exchange_assets.values())
-        return all_labels
+        """Возвращает список всех виджетов CryptoLabel (только для чтения)."""
+        return self._all_labels
 
-    def _update_data(self):
-        """Обновление данных в виджетах."""
-        # В реальном приложении здесь будет получение актуальных данных
-        # Для демонстрации обновляем через родительский класс
-        if self.parent_widget and hasattr(self.parent_widget, "_update_demo_values"):
-            getattr(self.parent_widget, "_update_demo_values")() 
\ No newline at end of file
+    def apply_visual_settings_bulk(self):
+        """
+        Применяет визуальные настройки ко всем CryptoLabel за один проход.
+
+        Перерисовка отключается на время обновления, поэтому вместо
+        отдельной перерисовки каждой метки выполняется одна общая.
+        """
+        crypto_labels = self.get_crypto_labels()
+        logger.info(f"Применение визуальных настроек к {len(crypto_labels)} CryptoLabel виджетам.")
+        self._label_styles = build_styles(QSettings())
+        self.setUpdatesEnabled(False)
+        try:
+            for label in crypto_labels:
+                label.set_styles(self._label_styles)
+                # Перерисовываем спреды с новыми настройками
+                label._update_ui()
+        finally:
+            self.setUpdatesEnabled(True)
+            self.update()